@@ -7,32 +7,131 @@ file explorer, all built with the tkinter library.
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, simpledialog
+from tkinter import ttk, filedialog, messagebox, simpledialog, colorchooser
+import ast
+import bisect
 import datetime
+import functools
 import json
 import base64
+import operator
 import sys
-import copy # Used for deep copying items to the recycle bin
+from collections import namedtuple, OrderedDict
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError: # Pillow is optional, Paint falls back to plain canvas lines without it
+    Image = ImageDraw = None
+
+
+class FileEntry(namedtuple("FileEntry", ["content", "size"])):
+    """
+    A file in the in-memory file system: its text and its UTF-8 size in bytes.
+    The size is computed once when the file is written, not on every lookup.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_text(cls, content):
+        # ASCII text is one byte per character, so skip building an encoded copy
+        size = len(content) if content.isascii() else len(content.encode('utf-8'))
+        return cls(content, size)
+
 
 # --- NEW: In-memory file system data structure ---
 # This dictionary will hold all files and folders.
-# Files are strings, folders are nested dictionaries.
+# Files are FileEntry tuples, folders are nested dictionaries.
 # This replaces the need for actual file system operations.
 in_memory_file_system = {
     'Documents': {
-        'my_first_file.txt': 'Hello, PyOS!',
+        'my_first_file.txt': FileEntry.from_text('Hello, PyOS!'),
         'A cool folder': {}
     },
     'Images': {},
-    # Hidden folder for deleted items (The Recycle Bin)
-    '.recyclebin': {} 
+    # Hidden folder for deleted items (The Recycle Bin), oldest deletion first
+    '.recyclebin': OrderedDict()
 }
 
+
+@functools.lru_cache(maxsize=1)
+def format_clock_minute(minute_of_day):
+    """
+    Formats a minute of the day (0-1439) as HH:MM for the taskbar clock.
+    """
+    return f"{minute_of_day // 60:02d}:{minute_of_day % 60:02d}"
+
+
+# Operators the calculator accepts, by AST node type
+CALC_BINARY_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.Mod: operator.mod, ast.Pow: operator.pow,
+}
+CALC_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+# Largest integer power result the calculator will build, in bits (about 5000 digits)
+CALC_MAX_POW_BITS = 16 * 1024
+
+
+@functools.lru_cache(maxsize=128)
+def evaluate_expression(expression):
+    """
+    Safely evaluates a calculator expression: numbers, + - * / % ** and brackets.
+    Anything else (names, calls, ...) raises ValueError. Results are cached,
+    so pressing = again on the same expression skips parsing entirely.
+    """
+    return _evaluate_node(ast.parse(expression, mode="eval").body)
+
+
+def _evaluate_node(node):
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in CALC_BINARY_OPS:
+        left, right = _evaluate_node(node.left), _evaluate_node(node.right)
+        # Keep something like 9**9**9 from freezing the UI. The limit is on the size
+        # of the result, so stacked powers like (9**999)**999 are caught too.
+        # Float powers overflow quickly on their own.
+        if (isinstance(node.op, ast.Pow) and type(left) is int and type(right) is int
+                and right > 0 and abs(left).bit_length() * right > CALC_MAX_POW_BITS):
+            raise ValueError("Result too large")
+        return CALC_BINARY_OPS[type(node.op)](left, right)
+    if isinstance(node, ast.UnaryOp) and type(node.op) in CALC_UNARY_OPS:
+        return CALC_UNARY_OPS[type(node.op)](_evaluate_node(node.operand))
+    raise ValueError("Unsupported expression")
+
+
+# Storage Limit
+STORAGE_LIMIT_MB = 64
+STORAGE_LIMIT_BYTES = STORAGE_LIMIT_MB * 1024 * 1024
+# Large folders are shown in the file explorer one page at a time
+TREE_PAGE_SIZE = 200
+# Notepad inserts large files into its editor this many characters at a time
+NOTEPAD_LOAD_CHUNK = 64 * 1024
+
 class PyOS:
     """
     Main class for the PyOS simulation.
     Manages the UI, windows, and core functionalities.
     """
+    # Start menu entries: (label, name of the PyOS method it launches)
+    START_MENU_APPS = (
+        ("Settings", "show_settings"),
+        ("Files", "show_file_explorer"),
+        ("Notepad", "show_notepad"),
+        ("Calculator", "show_calculator"),
+        ("Paint", "show_paint"),
+        ("Exit PyOS", "exit_pyos"),
+    )
+
+    # Calculator buttons layout: (text, row, column, kind, rowspan, columnspan)
+    # Each kind has a "Calc.<kind>.TButton" style, see CALC_BUTTON_COLORS
+    CALC_BUTTONS = (
+        ('7', 1, 0, 'Digit', 1, 1), ('8', 1, 1, 'Digit', 1, 1), ('9', 1, 2, 'Digit', 1, 1), ('/', 1, 3, 'Op', 1, 1),
+        ('4', 2, 0, 'Digit', 1, 1), ('5', 2, 1, 'Digit', 1, 1), ('6', 2, 2, 'Digit', 1, 1), ('*', 2, 3, 'Op', 1, 1),
+        ('1', 3, 0, 'Digit', 1, 1), ('2', 3, 1, 'Digit', 1, 1), ('3', 3, 2, 'Digit', 1, 1), ('-', 3, 3, 'Op', 1, 1),
+        ('0', 4, 0, 'Digit', 1, 1), ('.', 4, 1, 'Digit', 1, 1), ('=', 4, 2, 'Eq', 1, 1), ('+', 4, 3, 'Op', 1, 1),
+        ('C', 5, 0, 'Clr', 1, 4) # Clear button
+    )
+    CALC_BUTTON_COLORS = {'Digit': '#555555', 'Op': '#f39c12', 'Eq': '#4CAF50', 'Clr': '#e74c3c'}
+
     def __init__(self, master):
         self.master = master
         master.title("PyOS 1.06")
@@ -43,15 +142,39 @@ class PyOS:
         self.current_path_label = None
         self.status_bar_label = None
         self.tree = None # Ensure treeview is initialized
+        self._explorer_dirty = False # True while a file explorer refresh is scheduled
+        self._explorer_status = None # Status bar message to show once it runs
         self.file_system = in_memory_file_system
         self.current_path = [] # Path is now a list of keys
-
-        # Storage Limit
-        self.storage_limit_mb = 64
-        self.storage_limit_bytes = self.storage_limit_mb * 1024 * 1024
+        self._current_node = self.file_system # The folder at current_path, kept in sync with it
+
+        # Path index: maps each folder's path tuple to its dictionary so
+        # lookups don't have to walk down from the root every time.
+        self._dirs = {}
+        self._index_dir((), self.file_system)
+        # Sorted item names per folder path, filled in lazily by populate_tree
+        self._sorted_children = {}
+        # Listing of the folder shown in the explorer, and how many of its rows are in the tree
+        self._listing = []
+        self._shown = 0
+        # Numbers recycle bin keys so every deleted item gets a unique one
+        self._recycle_counter = 0
+        # Number of items in the recycle bin, kept alongside every change to it
+        self._recycle_count = len(self.file_system['.recyclebin'])
+
+        # Storage display (see STORAGE_LIMIT_MB for the limit itself)
         self.storage_label = None
         self.storage_bar = None
+        # What the storage bar currently shows, to skip redundant Tk updates
+        self._storage_style = None
+        self._storage_percentage = None
+        self._style = None # Shared ttk.Style, configured on first use
         self.settings = {"theme": "dark"}
+        self._clock_text = None # Last text shown on the taskbar clock
+
+        # Running total of file bytes, kept up to date by every mutation
+        # so storage checks don't have to walk the whole file system.
+        self._total_size = self._node_size(self.file_system)
 
         # Create the main user interface
         self.create_ui()
@@ -86,51 +209,62 @@ class PyOS:
                                    bg="#333333", fg="white")
         self.time_label.pack(side="right", padx=(5, 10))
 
-        # Open window list (for a more advanced taskbar)
+        # Open window list (for a more advanced taskbar), keyed by window title
         self.open_windows = {}
 
     def update_time(self):
         """
-        Updates the time label every second.
+        Updates the time label at the start of every minute.
         """
         now = datetime.datetime.now()
-        time_str = now.strftime("%H:%M:%S")
-        self.time_label.config(text=time_str)
-        self.master.after(1000, self.update_time)
+        self._refresh_clock(now)
+        ms_until_next_minute = (60 - now.second) * 1000 - now.microsecond // 1000
+        self.master.after(ms_until_next_minute, self.update_time)
+
+    def _refresh_clock(self, now):
+        time_str = format_clock_minute(now.hour * 60 + now.minute)
+        if time_str != self._clock_text: # Skip the Tk call if nothing changed
+            self._clock_text = time_str
+            self.time_label.config(text=time_str)
 
     def show_start_menu(self):
         """
-        Creates and displays the Start menu as a pop-up window.
+        Displays the Start menu as a pop-up window.
+        The menu is built on first use and only shown/hidden afterwards.
         """
-        if self.start_menu:
-            self.start_menu.destroy()
+        if self.start_menu is None:
+            self.build_start_menu()
 
-        self.start_menu = tk.Toplevel(self.master, bg="#444444", relief="raised", bd=2)
-        self.start_menu.overrideredirect(True)
-        self.start_menu.geometry("250x300")
-        
         start_button_x = self.start_button.winfo_rootx()
         start_button_y = self.start_button.winfo_rooty()
-        self.start_menu.geometry(f"+{start_button_x}+{start_button_y - 300}")
-
-        app_list = [
-            ("Settings", self.show_settings),
-            ("Files", self.show_file_explorer),
-            ("Notepad", lambda: self.show_notepad()), 
-            ("Calculator", self.show_calculator), # ADDED: Calculator
-            ("Paint", self.show_paint),
-            ("Exit PyOS", self.master.quit)
-        ]
-
-        for app_name, command in app_list:
+        self.start_menu.geometry(f"250x300+{start_button_x}+{start_button_y - 300}")
+        self.start_menu.deiconify()
+        self.start_menu.lift()
+        self.start_menu.focus_set()
+
+    def build_start_menu(self):
+        """
+        Creates the (initially hidden) Start menu window and its buttons.
+        """
+        self.start_menu = tk.Toplevel(self.master, bg="#444444", relief="raised", bd=2)
+        self.start_menu.overrideredirect(True)
+        self.start_menu.withdraw()
+
+        for app_name, method_name in self.START_MENU_APPS:
+            command = getattr(self, method_name)
             app_button = tk.Button(self.start_menu, text=app_name, font=("Inter", 12),
-                                   command=lambda cmd=command: (self.start_menu.destroy(), cmd()),
+                                   command=lambda cmd=command: (self.start_menu.withdraw(), cmd()),
                                    bg="#555555", fg="white", activebackground="#777777",
                                    relief="flat", bd=0, padx=10, pady=5)
             app_button.pack(fill="x", pady=2, padx=5)
 
-        self.start_menu.bind("<FocusOut>", lambda e: self.start_menu.destroy())
-        self.start_menu.focus_set()
+        self.start_menu.bind("<FocusOut>", lambda e: self.start_menu.withdraw())
+
+    def exit_pyos(self):
+        """
+        Quits the PyOS main loop.
+        """
+        self.master.quit()
 
     def create_app_window(self, title, width, height):
         """
@@ -166,8 +300,17 @@ class PyOS:
         title_bar.bind("<Button-1>", start_move)
         title_bar.bind("<B1-Motion>", on_move)
 
+        # Register the window so it can be found by title without scanning every widget
+        self.open_windows[title] = window
+        window.bind("<Destroy>", lambda e: self._forget_window(title, window) if e.widget is window else None, add="+")
+
         return window
 
+    def _forget_window(self, title, window):
+        # A newer window may have been registered under the same title since
+        if self.open_windows.get(title) is window:
+            del self.open_windows[title]
+
     def show_settings(self):
         """
         Opens the simulated Settings application.
@@ -213,40 +356,81 @@ class PyOS:
 
         self.settings["theme"] = theme
     
-    def calculate_directory_size(self):
+    def _node_size(self, node):
         """
-        Recursively calculates the size of the in-memory file system.
+        Calculates the size of a file or folder node.
+        Only used to seed and adjust the cached total, never per refresh.
         """
-        def get_size(node):
-            total_size = 0
-            for key, value in node.items():
+        if isinstance(node, FileEntry):
+            return node.size
+        # Walk with an explicit stack rather than recursion
+        total_size = 0
+        stack = [node]
+        while stack:
+            for value in stack.pop().values():
                 if isinstance(value, dict):
-                    total_size += get_size(value)
-                else:
-                    total_size += len(value.encode('utf-8'))
-            return total_size
+                    stack.append(value)
+                elif isinstance(value, FileEntry):
+                    total_size += value.size
+        return total_size
 
-        return get_size(self.file_system)
+    def calculate_directory_size(self):
+        """
+        Returns the size of the in-memory file system (recycle bin included).
+        """
+        return self._total_size
 
     def update_storage_display(self):
         """
         Updates the storage usage label and progress bar.
         """
+        # Nothing to update while the file explorer is closed
+        if not (self.storage_label and self.storage_label.winfo_exists()):
+            return
+
         used_space = self.calculate_directory_size()
         used_mb = used_space / (1024 * 1024)
         
-        if self.storage_label:
-            self.storage_label.config(text=f"Storage Used: {used_mb:.2f} MB / {self.storage_limit_mb:.0f} MB")
+        self.storage_label.config(text=f"Storage Used: {used_mb:.2f} MB / {STORAGE_LIMIT_MB:.0f} MB")
         
-        if self.storage_bar:
-            percentage = (used_space / self.storage_limit_bytes) * 100
-            self.storage_bar['value'] = percentage
+        if self.storage_bar and self.storage_bar.winfo_exists():
+            percentage = (used_space / STORAGE_LIMIT_BYTES) * 100
+            # Changes under half a percent aren't visible on the bar
+            if self._storage_percentage is None or abs(percentage - self._storage_percentage) > 0.5:
+                self._storage_percentage = percentage
+                self.storage_bar['value'] = percentage
+
             if percentage > 90:
-                self.storage_bar.configure(style="Red.TProgressbar")
+                style = "Red.TProgressbar"
             elif percentage > 70:
-                self.storage_bar.configure(style="Orange.TProgressbar")
+                style = "Orange.TProgressbar"
             else:
-                self.storage_bar.configure(style="Green.TProgressbar")
+                style = "Green.TProgressbar"
+            if style != self._storage_style:
+                self._storage_style = style
+                self.storage_bar.configure(style=style)
+
+    def _ensure_styles(self):
+        """
+        Configures the shared ttk styles the first time they are needed.
+        """
+        if self._style is not None:
+            return self._style
+
+        # --- Progress bar styling fix ---
+        self._style = ttk.Style()
+        self._style.theme_use("default") # Use a known theme
+        self._style.configure("Green.TProgressbar", foreground='green', background='green')
+        self._style.configure("Orange.TProgressbar", foreground='orange', background='orange')
+        self._style.configure("Red.TProgressbar", foreground='red', background='red')
+
+        # Calculator buttons share these instead of each passing its own colors and font
+        for kind, color in self.CALC_BUTTON_COLORS.items():
+            style_name = f"Calc.{kind}.TButton"
+            self._style.configure(style_name, font=('Inter', 14, 'bold'), background=color, foreground="white",
+                                  borderwidth=0, relief=tk.FLAT, width=1)
+            self._style.map(style_name, background=[("active", "#777777")])
+        return self._style
 
     def show_file_explorer(self):
         """
@@ -273,19 +457,16 @@ class PyOS:
         tree_frame = ttk.Frame(file_explorer, padding="10")
         tree_frame.pack(fill="both", expand=True)
 
-        self.tree = ttk.Treeview(tree_frame)
+        # Hidden columns carry each row's real name, so it never has to be parsed out of the label
+        self.tree = ttk.Treeview(tree_frame, columns=("name", "kind"), displaycolumns=())
         self.tree.pack(side="left", fill="both", expand=True)
+        self.tree.bind("<Double-1>", self.on_double_click_file_explorer)
 
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
         vsb.pack(side="right", fill="y")
         self.tree.configure(yscrollcommand=vsb.set)
         
-        # --- Progress bar styling fix ---
-        style = ttk.Style()
-        style.theme_use("default") # Use a known theme
-        style.configure("Green.TProgressbar", foreground='green', background='green')
-        style.configure("Orange.TProgressbar", foreground='orange', background='orange')
-        style.configure("Red.TProgressbar", foreground='red', background='red')
+        self._ensure_styles()
         
         # Storage display at the bottom of the file explorer
         storage_frame = tk.Frame(file_explorer, bg="#444444", padx=10, pady=5)
@@ -297,6 +478,8 @@ class PyOS:
         self.storage_bar = ttk.Progressbar(storage_frame, orient="horizontal", length=200, mode="determinate", style="Green.TProgressbar")
         self.storage_bar.pack(side="right")
         self.storage_bar["maximum"] = 100
+        self._storage_style = "Green.TProgressbar"
+        self._storage_percentage = None
 
         # Status bar
         self.status_bar_label = tk.Label(file_explorer, text="", bd=1, relief=tk.SUNKEN, anchor=tk.W)
@@ -306,16 +489,26 @@ class PyOS:
         self.update_storage_display()
         self.status_bar_label.config(text="File explorer loaded.")
         
-    def get_current_node(self):
-        node = self.file_system
-        for key in self.current_path:
-            # Safely navigate the dictionary
-            if isinstance(node, dict) and key in node:
-                node = node[key]
-            else:
-                return {} # Return an empty node if path is invalid
-        return node
-        
+    def _index_dir(self, path, node):
+        """
+        Adds a folder and all of its subfolders to the path index.
+        """
+        self._dirs[path] = node
+        for name, value in node.items():
+            # The recycle bin holds metadata records, not browsable folders
+            if isinstance(value, dict) and not (name == '.recyclebin' and not path):
+                self._index_dir(path + (name,), value)
+
+    def _unindex_dir(self, path):
+        """
+        Removes a folder and all of its subfolders from the path index,
+        along with their cached listings.
+        """
+        depth = len(path)
+        for key in [key for key in self._dirs if key[:depth] == path]:
+            del self._dirs[key]
+            self._sorted_children.pop(key, None)
+
     def populate_tree(self):
         """
         Populates the file explorer treeview from the in-memory file system.
@@ -328,47 +521,121 @@ class PyOS:
 
         # Back button/nav
         if len(self.current_path) > 0:
-            self.tree.insert("", "end", text="[..] Back", values=("..",))
-
-        current_node = self.get_current_node()
-        items = sorted(current_node.keys())
-        
-        for item in items:
+            self.tree.insert("", "end", iid="__back__", text="[..] Back")
+
+        # Reuse the folder's sorted listing if we have one. The incremental
+        # tree updates below keep it in order, so it is only built once.
+        path = tuple(self.current_path)
+        self._listing = self._sorted_children.get(path)
+        if self._listing is None:
+            current_node = self._current_node
             # Skip hidden recycle bin folder in normal view
-            if item == '.recyclebin' and len(self.current_path) == 0:
-                continue
+            self._listing = [item for item in sorted(current_node.keys())
+                             if not (item == '.recyclebin' and len(self.current_path) == 0)]
+            self._sorted_children[path] = self._listing
+        self._shown = 0
+        self._insert_tree_page()
 
-            item_path = "/".join(self.current_path + [item])
-            if isinstance(current_node[item], dict):
-                # Folder: use [D] for directory
-                self.tree.insert("", "end", text=f"[D] {item}", values=(item_path,))
-            else:
-                # File: use [F] for file
-                self.tree.insert("", "end", text=f"[F] {item}", values=(item_path,))
-            
-        self.tree.bind("<Double-1>", self.on_double_click_file_explorer)
+    def _tree_iid(self, name):
+        """
+        Returns the treeview item id for an item in the current folder: its full path.
+        """
+        return "/" + "".join(key + "/" for key in self.current_path) + name
+
+    def _insert_tree_row(self, item, index, is_dir):
+        """
+        Inserts one item row at the given position in the current folder's listing.
+        """
+        # Folder: use [D] for directory, File: use [F] for file
+        kind = "D" if is_dir else "F"
+        offset = 1 if len(self.current_path) > 0 else 0 # Rows come after [..] Back
+        self.tree.insert("", offset + index, iid=self._tree_iid(item), text=f"[{kind}] {item}", values=(item, kind))
+
+    def _update_more_row(self):
+        """
+        Adds, updates or removes the trailing "show more" row.
+        """
+        remaining = len(self._listing) - self._shown
+        if not remaining:
+            if self.tree.exists("__more__"):
+                self.tree.delete("__more__")
+        elif self.tree.exists("__more__"):
+            self.tree.item("__more__", text=f"[...] Show {remaining} more")
+        else:
+            self.tree.insert("", "end", iid="__more__", text=f"[...] Show {remaining} more")
+
+    def _insert_tree_page(self):
+        """
+        Inserts the next TREE_PAGE_SIZE items of the current folder into the tree,
+        followed by a "show more" row if any are still left.
+        """
+        current_node = self._current_node
+        end = min(self._shown + TREE_PAGE_SIZE, len(self._listing))
+        for index in range(self._shown, end):
+            item = self._listing[index]
+            self._insert_tree_row(item, index, isinstance(current_node[item], dict))
+        self._shown = end
+        self._update_more_row()
+
+    def _tree_add(self, name, is_dir):
+        """
+        Adds a single new item of the current folder to the tree in sorted order,
+        instead of repopulating the whole tree.
+        """
+        index = bisect.bisect_left(self._listing, name)
+        self._listing.insert(index, name)
+        # Items past the loaded page just bump the "show more" count
+        if index <= self._shown:
+            self._insert_tree_row(name, index, is_dir)
+            self._shown += 1
+        self._update_more_row()
+
+    def _tree_remove(self, name):
+        """
+        Removes a single item of the current folder from the tree.
+        """
+        index = bisect.bisect_left(self._listing, name)
+        del self._listing[index]
+        if index < self._shown:
+            self.tree.delete(self._tree_iid(name))
+            self._shown -= 1
+        self._update_more_row()
+
+    def _tree_rename(self, old_name, new_name, is_dir):
+        """
+        Moves a renamed item to its new sorted position in the tree.
+        Row ids are full paths, so the row is re-inserted under its new id.
+        """
+        self._tree_remove(old_name)
+        self._tree_add(new_name, is_dir)
 
     def on_double_click_file_explorer(self, event):
         """
         Handles double-click events in the file explorer tree.
         """
         item_id = self.tree.focus()
-        item_text = self.tree.item(item_id, "text")
+        if not item_id:
+            return
+        if item_id == "__more__":
+            return self._insert_tree_page()
 
-        if item_text == "[..] Back":
+        if item_id == "__back__":
             if len(self.current_path) > 0:
                 self.current_path.pop()
+                # Use an empty node if the parent no longer exists
+                self._current_node = self._dirs.get(tuple(self.current_path), {})
         else:
-            # Extract the actual item name from the formatted string
-            item_name = item_text.split("] ")[1]
-            current_node = self.get_current_node()
+            item_name = self.tree.set(item_id, "name")
+            current_node = self._current_node
             
             if isinstance(current_node.get(item_name), dict):
                 self.current_path.append(item_name)
+                self._current_node = current_node[item_name]
             else:
                 # Open the file for viewing/editing using the new Notepad
                 full_path = self.current_path[:] # A copy of the current path
-                file_content = current_node.get(item_name, "File not found.")
+                file_entry = current_node.get(item_name)
+                file_content = file_entry.content if file_entry else "File not found."
                 
                 # LAUNCH NOTEPAD
                 self.show_notepad(filename=item_name, initial_content=file_content, file_path=full_path) 
@@ -392,6 +659,7 @@ class PyOS:
         notepad_window.filename = filename
         notepad_window.file_path = file_path # The list of folder names leading to the file
         notepad_window.is_saved = True # Initial state is saved if opening existing, or blank new.
+        notepad_window.is_loading = False # True while a large file is still being inserted
 
         # Menu Bar
         menu_bar = tk.Menu(notepad_window)
@@ -419,15 +687,22 @@ class PyOS:
         notepad_window.text_widget = text_widget
         
         # Load content
-        text_widget.insert(tk.END, initial_content)
+        if len(initial_content) > NOTEPAD_LOAD_CHUNK:
+            self.load_notepad_content(notepad_window, initial_content)
+        else:
+            text_widget.insert(tk.END, initial_content)
+            text_widget.edit_modified(False)
         
-        # Unsaved changes tracker
+        # Unsaved changes tracker. <<Modified>> only fires when the text's
+        # modified flag flips, not on every keystroke like <KeyRelease>.
         def mark_unsaved(event):
-            if notepad_window.is_saved:
+            if notepad_window.is_loading:
+                return
+            if text_widget.edit_modified() and notepad_window.is_saved:
                 notepad_window.is_saved = False
                 notepad_window.title(f"Notepad - *{notepad_window.filename or 'Untitled'}")
 
-        text_widget.bind("<KeyRelease>", mark_unsaved)
+        text_widget.bind("<<Modified>>", mark_unsaved)
 
         # Prompt before closing if unsaved
         def on_closing():
@@ -440,7 +715,42 @@ class PyOS:
         notepad_window.protocol("WM_DELETE_WINDOW", on_closing)
         
         # Refresh the file explorer when this window is closed
-        notepad_window.bind("<Destroy>", lambda e: self.refresh_file_explorer())
+        # (<Destroy> is also delivered for every child widget, so filter those out)
+        notepad_window.bind("<Destroy>", lambda e: self.refresh_file_explorer() if e.widget is notepad_window else None, add="+")
+
+    def load_notepad_content(self, window, content):
+        """
+        Inserts a large file into a Notepad window one chunk at a time, so the
+        UI keeps repainting instead of freezing for the whole insert.
+        The editor is read-only and shows a progress label until loading is done.
+        """
+        text_widget = window.text_widget
+        window.is_loading = True
+        text_widget.config(state="disabled")
+
+        progress_label = tk.Label(window, text="Loading... 0%", bg="#444444", fg="white", font=("Inter", 9))
+        progress_label.place(relx=1.0, rely=1.0, anchor="se", x=-10, y=-10)
+
+        def load_chunk(start):
+            if not text_widget.winfo_exists():
+                return # Window was closed mid-load
+
+            end = start + NOTEPAD_LOAD_CHUNK
+            text_widget.config(state="normal")
+            text_widget.insert(tk.END, content[start:end])
+
+            if end < len(content):
+                text_widget.config(state="disabled")
+                progress_label.config(text=f"Loading... {end * 100 // len(content)}%")
+                # Wait for idle first so the pending redraws run between chunks
+                window.after_idle(window.after, 0, load_chunk, end)
+            else:
+                progress_label.destroy()
+                text_widget.edit_reset() # Loading shouldn't be undoable chunk by chunk
+                text_widget.edit_modified(False)
+                window.is_loading = False
+
+        window.after(0, load_chunk, 0)
 
 
     def save_notepad_file(self, window, save_as=False):
@@ -448,21 +758,19 @@ class PyOS:
         Saves the content of the Notepad editor to the in-memory file system.
         Handles both saving an existing file and 'Save As' for new files.
         """
+        if window.is_loading:
+            return messagebox.showinfo("Please Wait", "The file is still loading.")
+
         content = window.text_widget.get("1.0", tk.END).strip()
-        
-        # Calculate new size to check against limit
-        content_size = len(content.encode('utf-8'))
 
         # --- Get the target node (path to the file) ---
         target_node = self.file_system
         if window.file_path:
-            for key in window.file_path:
-                target_node = target_node.get(key)
-                if not target_node or not isinstance(target_node, dict):
-                    messagebox.showerror("Save Error", "Original path is invalid. Saving to root (/).")
-                    target_node = self.file_system # Fallback to root
-                    window.file_path = []
-                    break
+            target_node = self._dirs.get(tuple(window.file_path))
+            if target_node is None:
+                messagebox.showerror("Save Error", "Original path is invalid. Saving to root (/).")
+                target_node = self.file_system # Fallback to root
+                window.file_path = []
 
         # --- Handle Save As / New File ---
         if save_as or not window.filename:
@@ -471,7 +779,7 @@ class PyOS:
                 return # User cancelled
             
             # Use the current File Explorer path for "Save As" location
-            current_explorer_node = self.get_current_node() 
+            current_explorer_node = self._current_node 
             if new_name in current_explorer_node and new_name != window.filename:
                  if not messagebox.askyesno("File Exists", f"Overwrite existing file '{new_name}'?"):
                     return
@@ -481,23 +789,31 @@ class PyOS:
             window.file_path = self.current_path[:] 
 
         # --- Final Save & Storage Check ---
-        old_size = len(target_node.get(window.filename, "").encode('utf-8'))
+        existing = target_node.get(window.filename)
+        if isinstance(existing, dict):
+            return messagebox.showerror("Save Error", f"A folder named '{window.filename}' already exists.")
+        old_size = existing.size if existing else 0
+
+        # Calculate new size to check against limit (the only place the content is measured)
+        new_entry = FileEntry.from_text(content)
         
         # Check if the new size exceeds the total limit after accounting for the old size
         current_total_size = self.calculate_directory_size()
-        size_change = content_size - old_size
+        size_change = new_entry.size - old_size
         
-        if (current_total_size + size_change) > self.storage_limit_bytes:
+        if (current_total_size + size_change) > STORAGE_LIMIT_BYTES:
             return messagebox.showerror("Storage Full", "Cannot save file. Storage limit reached.")
 
         # Save the content and update window metadata
-        target_node[window.filename] = content
+        target_node[window.filename] = new_entry
+        if existing is None:
+            self._sorted_children.pop(tuple(window.file_path), None) # New item in that folder
+        self._total_size += size_change
         window.title(f"Notepad - {window.filename}")
         window.is_saved = True
+        window.text_widget.edit_modified(False) # Re-arm the <<Modified>> event
         
-        self.status_bar_label.config(text=f"File '{window.filename}' saved successfully.")
-        self.update_storage_display()
-        self.refresh_file_explorer()
+        self.refresh_file_explorer(f"File '{window.filename}' saved successfully.")
     # --- END: Notepad Application Methods ---
 
 
@@ -508,14 +824,14 @@ class PyOS:
         new_file_name = simpledialog.askstring("New File", "Enter the new file name:")
         if new_file_name:
             # Check for storage limit
-            if self.calculate_directory_size() < self.storage_limit_bytes:
-                current_node = self.get_current_node()
+            if self.calculate_directory_size() < STORAGE_LIMIT_BYTES:
+                current_node = self._current_node
                 if new_file_name in current_node:
                     messagebox.showwarning("File Exists", f"A file or folder with the name '{new_file_name}' already exists.")
                 else:
-                    current_node[new_file_name] = "" # Create an empty file
-                    self.status_bar_label.config(text=f"File '{new_file_name}' created.")
-                    self.populate_tree()
+                    current_node[new_file_name] = FileEntry("", 0) # Create an empty file
+                    self._set_status(f"File '{new_file_name}' created.")
+                    self._tree_add(new_file_name, False)
                     self.update_storage_display()
             else:
                 messagebox.showerror("Storage Full", "Cannot create new file. Storage limit reached.")
@@ -526,13 +842,14 @@ class PyOS:
         """
         new_folder_name = simpledialog.askstring("New Folder", "Enter the new folder name:")
         if new_folder_name:
-            current_node = self.get_current_node()
+            current_node = self._current_node
             if new_folder_name in current_node:
                 messagebox.showwarning("Folder Exists", f"A file or folder with the name '{new_folder_name}' already exists.")
             else:
                 current_node[new_folder_name] = {} # Create an empty folder
-                self.status_bar_label.config(text=f"Folder '{new_folder_name}' created.")
-                self.populate_tree()
+                self._dirs[tuple(self.current_path) + (new_folder_name,)] = current_node[new_folder_name]
+                self._set_status(f"Folder '{new_folder_name}' created.")
+                self._tree_add(new_folder_name, True)
                 self.update_storage_display()
 
     def rename_selected_item(self):
@@ -542,60 +859,79 @@ class PyOS:
         item_id = self.tree.focus()
         if not item_id:
             return messagebox.showwarning("No Item Selected", "Please select a file or folder to rename.")
-        
-        item_text = self.tree.item(item_id, "text")
-        if item_text == "[..] Back":
+        if item_id == "__more__":
+            return
+        if item_id == "__back__":
              return messagebox.showwarning("Cannot Rename", "Cannot rename the back navigation item.")
              
-        old_name = item_text.split("] ")[1]
+        old_name = self.tree.set(item_id, "name")
         
         new_name = simpledialog.askstring("Rename", f"Enter a new name for '{old_name}':", initialvalue=old_name)
         if new_name and new_name != old_name:
-            current_node = self.get_current_node()
+            current_node = self._current_node
             if new_name in current_node:
                 return messagebox.showwarning("Name Exists", f"A file or folder with the name '{new_name}' already exists.")
             
             # Copy the old item to the new name and delete the old one
             current_node[new_name] = current_node.pop(old_name)
-            self.status_bar_label.config(text=f"'{old_name}' renamed to '{new_name}'.")
-            self.populate_tree()
+            if isinstance(current_node[new_name], dict):
+                self._unindex_dir(tuple(self.current_path) + (old_name,))
+                self._index_dir(tuple(self.current_path) + (new_name,), current_node[new_name])
+            self._set_status(f"'{old_name}' renamed to '{new_name}'.")
+            self._tree_rename(old_name, new_name, isinstance(current_node[new_name], dict))
 
     def delete_selected_item(self):
         """
-        Moves the selected file or folder to the .recyclebin.
+        Moves the selected files and folders to the .recyclebin,
+        asking for confirmation once for the whole selection.
         """
-        item_id = self.tree.focus()
-        if not item_id:
+        selection = self.tree.selection()
+        if not selection:
             return messagebox.showwarning("No Item Selected", "Please select a file or folder to delete.")
-            
-        item_text = self.tree.item(item_id, "text")
-        if item_text == "[..] Back":
-             return messagebox.showwarning("Cannot Delete", "Cannot delete the back navigation item.")
 
-        item_name = item_text.split("] ")[1]
-        current_node = self.get_current_node()
-        
-        if messagebox.askyesno("Delete Item", f"Move '{item_name}' to the Recycle Bin?"):
-            if item_name in current_node:
-                # 1. Get a deep copy of the item to preserve its content/structure
-                item_to_move = copy.deepcopy(current_node[item_name])
-                
-                # 2. Delete it from the current location
-                del current_node[item_name]
-                
-                # 3. Move it to the recycle bin with a timestamp/unique key to avoid name conflicts
-                timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-                recycle_key = f"{item_name}_DELETED_{timestamp}"
-                
-                self.file_system['.recyclebin'][recycle_key] = {
-                    'original_name': item_name,
-                    'original_path': self.current_path[:], # Store a copy of the path where it was deleted
-                    'content': item_to_move
-                }
-                
-                self.status_bar_label.config(text=f"'{item_name}' moved to Recycle Bin.")
-                self.populate_tree()
-                self.update_storage_display()
+        # Navigation rows are skipped, they aren't real items
+        item_ids = [item_id for item_id in selection if item_id not in ("__back__", "__more__")]
+        if not item_ids:
+            if "__back__" in selection:
+                return messagebox.showwarning("Cannot Delete", "Cannot delete the back navigation item.")
+            return
+
+        item_names = [self.tree.set(item_id, "name") for item_id in item_ids]
+        if len(item_names) == 1:
+            prompt = f"Move '{item_names[0]}' to the Recycle Bin?"
+        else:
+            prompt = f"Move {len(item_names)} items to the Recycle Bin?"
+        if not messagebox.askyesno("Delete Item", prompt):
+            return
+
+        current_node = self._current_node
+        for item_name in item_names:
+            if item_name not in current_node:
+                continue
+
+            # 1. Take the item out of the current location. Nothing else
+            #    references it afterwards, so no copy is needed.
+            item_to_move = current_node.pop(item_name)
+            if isinstance(item_to_move, dict):
+                self._unindex_dir(tuple(self.current_path) + (item_name,))
+            
+            # 2. Move it to the recycle bin with a unique key to avoid name conflicts
+            self._recycle_counter += 1
+            recycle_key = f"{item_name}_DEL_{self._recycle_counter}"
+            
+            self.file_system['.recyclebin'][recycle_key] = {
+                'original_name': item_name,
+                'original_path': self.current_path[:], # Store a copy of the path where it was deleted
+                'content': item_to_move
+            }
+            self._recycle_count += 1
+            self._tree_remove(item_name)
+
+        if len(item_names) == 1:
+            self._set_status(f"'{item_names[0]}' moved to Recycle Bin.")
+        else:
+            self._set_status(f"{len(item_names)} items moved to Recycle Bin.")
+        self.update_storage_display()
     
     # --- START: Recycle Bin Management Methods ---
 
@@ -603,6 +939,9 @@ class PyOS:
         """
         Opens a separate window for managing the Recycle Bin (restore/empty).
         """
+        # Only one Recycle Bin window at a time, so the registered one covers it
+        if "Recycle Bin" in self.open_windows:
+            self.open_windows["Recycle Bin"].destroy()
         recycle_window = self.create_app_window("Recycle Bin", 500, 400)
         
         control_frame = tk.Frame(recycle_window, bg="#2e2e2e", padx=10, pady=5)
@@ -627,8 +966,17 @@ class PyOS:
         self.populate_recycle_bin(recycle_tree)
         
         # Status bar for recycle bin
-        recycle_status_label = tk.Label(recycle_window, text=f"Items: {len(self.file_system['.recyclebin'])}", bd=1, relief=tk.SUNKEN, anchor=tk.W)
+        recycle_status_label = tk.Label(recycle_window, text=f"Items: {self._recycle_count}", bd=1, relief=tk.SUNKEN, anchor=tk.W)
         recycle_status_label.pack(side=tk.BOTTOM, fill=tk.X)
+        recycle_window.status_label = recycle_status_label
+
+    def _update_recycle_status(self):
+        """
+        Updates the item count shown in the Recycle Bin window, if it is open.
+        """
+        recycle_window = self.open_windows.get("Recycle Bin")
+        if recycle_window is not None:
+            recycle_window.status_label.config(text=f"Items: {self._recycle_count}")
 
     def populate_recycle_bin(self, tree_widget):
         """
@@ -640,7 +988,8 @@ class PyOS:
             original_name = value['original_name']
             item_type = "[D]" if isinstance(value['content'], dict) else "[F]"
             
-            tree_widget.insert("", "end", text=item_type, 
+            # The row id is the recycle bin key, so selections map straight back to items
+            tree_widget.insert("", "end", iid=key, text=item_type, 
                                values=(original_name, key))
 
     def restore_item(self, tree_widget):
@@ -651,8 +1000,8 @@ class PyOS:
         if not selected_item_id:
             return messagebox.showwarning("Selection Error", "Please select an item to restore.")
             
-        # Get the unique key from the values
-        key_to_restore = tree_widget.item(selected_item_id, 'values')[1]
+        # The row id is the unique recycle bin key
+        key_to_restore = selected_item_id
         item_data = self.file_system['.recyclebin'].get(key_to_restore)
         
         if not item_data: return
@@ -661,82 +1010,123 @@ class PyOS:
         original_name = item_data['original_name']
         content_to_restore = item_data['content']
 
-        # Determine the target restoration node by traversing the path
-        restore_node = self.file_system
-        for key in original_path_list:
-            if key in restore_node and isinstance(restore_node[key], dict):
-                restore_node = restore_node[key]
-            else:
-                # If the original folder path is missing, restore to root
-                restore_node = self.file_system
-                original_path_list = []
-                messagebox.showwarning("Path Missing", f"Original path for '{original_name}' not found. Restoring to root (/).")
-                break
+        # Determine the target restoration node from the path index
+        restore_node = self._dirs.get(tuple(original_path_list))
+        if restore_node is None:
+            # If the original folder path is missing, restore to root
+            restore_node = self.file_system
+            original_path_list = []
+            messagebox.showwarning("Path Missing", f"Original path for '{original_name}' not found. Restoring to root (/).")
 
         # Check for name collision in the restoration location
         if original_name in restore_node:
-            response = messagebox.askyesno("Name Conflict", f"'{original_name}' already exists at the restoration location. Restore as '{original_name}_restored' instead?")
+            # Pick a name that is free too, so nothing gets silently overwritten
+            new_name = f"{original_name}_restored"
+            suffix = 2
+            while new_name in restore_node:
+                new_name = f"{original_name}_restored_{suffix}"
+                suffix += 1
+            response = messagebox.askyesno("Name Conflict", f"'{original_name}' already exists at the restoration location. Restore as '{new_name}' instead?")
             if response:
-                original_name += "_restored"
+                original_name = new_name
             else:
                 return
 
         # Restore the item and update the recycle bin
         restore_node[original_name] = content_to_restore
+        self._sorted_children.pop(tuple(original_path_list), None)
+        if isinstance(content_to_restore, dict):
+            self._index_dir(tuple(original_path_list) + (original_name,), content_to_restore)
         del self.file_system['.recyclebin'][key_to_restore]
+        self._recycle_count -= 1
         
         messagebox.showinfo("Restored", f"'{original_name}' restored to /{'/'.join(original_path_list)}")
         
-        # Refresh both the Recycle Bin window and the File Explorer (if open)
-        self.populate_recycle_bin(tree_widget)
+        # Drop just this row from the Recycle Bin window and refresh the File Explorer (if open)
+        tree_widget.delete(selected_item_id)
+        self._update_recycle_status()
         self.refresh_file_explorer()
 
     def permanently_delete_item(self, tree_widget):
         """
-        Permanently deletes the selected item from the recycle bin.
+        Permanently deletes the selected items from the recycle bin,
+        asking for confirmation once for the whole selection.
         """
-        selected_item_id = tree_widget.focus()
-        if not selected_item_id:
+        selection = tree_widget.selection()
+        if not selection:
             return messagebox.showwarning("Selection Error", "Please select an item to permanently delete.")
-            
-        key_to_delete = tree_widget.item(selected_item_id, 'values')[1]
-        original_name = tree_widget.item(selected_item_id, 'values')[0]
-        
-        if messagebox.askyesno("Confirm Delete", f"Are you SURE you want to permanently delete '{original_name}'?"):
-            del self.file_system['.recyclebin'][key_to_delete]
-            self.status_bar_label.config(text=f"'{original_name}' permanently deleted.")
-            self.populate_recycle_bin(tree_widget)
+
+        recycle_bin = self.file_system['.recyclebin']
+        if len(selection) == 1:
+            original_name = recycle_bin[selection[0]]['original_name']
+            prompt = f"Are you SURE you want to permanently delete '{original_name}'?"
+            status = f"'{original_name}' permanently deleted."
+        else:
+            prompt = f"Are you SURE you want to permanently delete {len(selection)} items?"
+            status = f"{len(selection)} items permanently deleted."
+
+        if messagebox.askyesno("Confirm Delete", prompt):
+            # Tree item ids are the recycle bin keys
+            for key_to_delete in selection:
+                item_data = recycle_bin.pop(key_to_delete)
+                self._total_size -= self._node_size(item_data['content'])
+            self._recycle_count -= len(selection)
+            tree_widget.delete(*selection)
+            self._set_status(status)
+            self._update_recycle_status()
             self.update_storage_display()
 
     def empty_recycle_bin(self):
         """
         Permanently deletes all contents of the recycle bin.
         """
-        count = len(self.file_system['.recyclebin'])
+        count = self._recycle_count
         if count == 0:
             return messagebox.showinfo("Recycle Bin", "Recycle Bin is already empty.")
 
         if messagebox.askyesno("Empty Recycle Bin", f"Are you SURE you want to permanently delete all {count} items in the Recycle Bin?"):
-            self.file_system['.recyclebin'] = {}
-            self.status_bar_label.config(text="Recycle Bin emptied.")
+            for item_data in self.file_system['.recyclebin'].values():
+                self._total_size -= self._node_size(item_data['content'])
+            self.file_system['.recyclebin'].clear()
+            self._recycle_count = 0
+            self._set_status("Recycle Bin emptied.")
             
             # Close the recycle bin window if it exists and refresh explorer
-            for window in self.master.winfo_children():
-                if isinstance(window, tk.Toplevel) and window.title() == "Recycle Bin":
-                    window.destroy()
+            recycle_window = self.open_windows.get("Recycle Bin")
+            if recycle_window is not None:
+                recycle_window.destroy()
 
             self.refresh_file_explorer()
     # --- END: Recycle Bin Management Methods ---
 
 
-    def refresh_file_explorer(self):
+    def refresh_file_explorer(self, status="File explorer refreshed."):
         """
-        Refreshes the file explorer view.
+        Schedules a refresh of the file explorer view for the next idle moment.
+        Several calls in a row collapse into one refresh, showing the last status.
         """
-        if self.tree:
-            self.populate_tree()
-            self.update_storage_display()
-            self.status_bar_label.config(text="File explorer refreshed.")
+        self._explorer_status = status
+        if not self._explorer_dirty:
+            self._explorer_dirty = True
+            self.master.after_idle(self._do_refresh_file_explorer)
+
+    def _do_refresh_file_explorer(self):
+        """
+        Refreshes the file explorer view, if it is open.
+        """
+        self._explorer_dirty = False
+        if not self.tree or not self.tree.winfo_exists():
+            return
+        self.populate_tree()
+        self.update_storage_display()
+        self._set_status(self._explorer_status)
+
+    def _set_status(self, text):
+        """
+        Shows a message in the file explorer status bar, if it is open.
+        """
+        if self.status_bar_label and self.status_bar_label.winfo_exists():
+            self.status_bar_label.config(text=text)
 
     # --- START: Calculator Application Methods ---
 
@@ -746,64 +1136,58 @@ class PyOS:
         """
         calc_window = self.create_app_window("Calculator", 250, 300)
         calc_window.configure(bg="#2e2e2e")
+        self._ensure_styles()
+
+        # The title bar is packed into the window, so the grid lives in its own frame below it
+        keypad = tk.Frame(calc_window, bg="#2e2e2e")
+        keypad.pack(side="top", fill="both", expand=True)
         
         # Entry field to display numbers and results
-        self.calc_entry = tk.Entry(calc_window, width=14, font=('Inter', 20), bd=5, relief=tk.FLAT, 
+        self.calc_entry = tk.Entry(keypad, width=14, font=('Inter', 20), bd=5, relief=tk.FLAT, 
                                    bg="#3c3c3c", fg="white", justify='right')
         self.calc_entry.grid(row=0, column=0, columnspan=4, padx=5, pady=5, sticky="nsew")
 
-        # Calculator buttons layout
-        buttons = [
-            ('7', 1, 0, '#555555'), ('8', 1, 1, '#555555'), ('9', 1, 2, '#555555'), ('/', 1, 3, '#f39c12'),
-            ('4', 2, 0, '#555555'), ('5', 2, 1, '#555555'), ('6', 2, 2, '#555555'), ('*', 2, 3, '#f39c12'),
-            ('1', 3, 0, '#555555'), ('2', 3, 1, '#555555'), ('3', 3, 2, '#555555'), ('-', 3, 3, '#f39c12'),
-            ('0', 4, 0, '#555555'), ('.', 4, 1, '#555555'), ('=', 4, 2, '#4CAF50', 1, 2), ('+', 4, 3, '#f39c12'),
-            ('C', 5, 0, '#e74c3c', 1, 4) # Clear button
-        ]
-        
-        # Configure button size (weights)
-        for i in range(4):
-            calc_window.grid_columnconfigure(i, weight=1)
-        for i in range(6):
-            calc_window.grid_rowconfigure(i, weight=1)
-
-        for (text, r, c, bg_color, r_span, c_span) in [(t, r, c, bg, 1, 1) for t, r, c, bg in buttons[:16]] + [(buttons[16][0], buttons[16][1], buttons[16][2], buttons[16][3], buttons[16][4], buttons[16][5])]:
-            
-            if text == '=':
-                cmd = self.calculate_expression
-            elif text == 'C':
-                cmd = lambda t=text: self.calc_entry.delete(0, tk.END)
-            else:
-                cmd = lambda t=text: self.calc_entry.insert(tk.END, t)
-
-            btn = tk.Button(calc_window, text=text, font=('Inter', 14, 'bold'),
-                            bg=bg_color, fg="white", bd=0, relief=tk.FLAT, 
-                            activebackground="#777777", command=cmd)
-            
+        for (text, r, c, kind, r_span, c_span) in self.CALC_BUTTONS:
+            # Every button shares one handler, which gets the button's own label
+            btn = ttk.Button(keypad, text=text, style=f"Calc.{kind}.TButton",
+                             command=functools.partial(self._on_calc_button, text))
             btn.grid(row=r, column=c, rowspan=r_span, columnspan=c_span, sticky="nsew", padx=2, pady=2)
 
+        # Configure button size (weights). "all" covers every row and column holding a
+        # widget, so this must come after the grid calls above
+        keypad.tk.call('grid', 'columnconfigure', keypad, 'all', '-weight', 1)
+        keypad.tk.call('grid', 'rowconfigure', keypad, 'all', '-weight', 1)
+
+    def _on_calc_button(self, text):
+        if text == '=':
+            self.calculate_expression()
+        elif text == 'C':
+            self.clear_calculator()
+        else:
+            self.calc_entry.insert(tk.END, text)
+
+    def clear_calculator(self):
+        """
+        Clears the calculator entry field.
+        """
+        self.calc_entry.delete(0, tk.END)
 
     def calculate_expression(self):
         """
         Evaluates the expression in the calculator entry field.
         """
-        expression = self.calc_entry.get().replace('x', '*') # Replace 'x' with '*' for Python's eval
+        expression = self.calc_entry.get().replace('x', '*') # Replace 'x' with '*' for multiplication
         
         try:
             # Use safe evaluation to calculate the result
-            # NOTE: For a production-level OS, using ast.literal_eval or a custom parser 
-            # is safer than direct eval(), but for a simulation, eval() is simplest.
-            result = str(eval(expression))
-            
-            self.calc_entry.delete(0, tk.END)
-            self.calc_entry.insert(0, result)
-            
+            result = str(evaluate_expression(expression))
         except ZeroDivisionError:
-            self.calc_entry.delete(0, tk.END)
-            self.calc_entry.insert(0, "Error: Div by Zero")
-        except:
-            self.calc_entry.delete(0, tk.END)
-            self.calc_entry.insert(0, "Error")
+            result = "Error: Div by Zero"
+        except Exception:
+            result = "Error"
+
+        self.calc_entry.delete(0, tk.END)
+        self.calc_entry.insert(0, result)
     # --- END: Calculator Application Methods ---
 
     # --- START: Paint Application Methods ---
@@ -817,32 +1201,151 @@ class PyOS:
                                       command=self.choose_color_for_paint, bd=0)
         self.color_button.pack(side="left", padx=5, pady=5)
         
-        clear_button = tk.Button(control_frame, text="Clear", command=lambda: self.canvas.delete("all"),
+        clear_button = tk.Button(control_frame, text="Clear", command=self.clear_paint,
                                  bg="#e74c3c", fg="white", bd=0)
         clear_button.pack(side="right", padx=5, pady=5)
 
         self.canvas = tk.Canvas(paint_window, bg="white", width=800, height=600)
         self.canvas.pack(fill="both", expand=True)
 
-        self.last_x, self.last_y = None, None
-
-        self.canvas.bind("<B1-Motion>", self.draw_line)
+        # With Pillow, strokes are drawn into one image shown on the canvas,
+        # so redraw cost doesn't grow with the number of strokes drawn
+        self._paint_img = None
+        self._paint_dirty = None # [x0, y0, x1, y1] of the image not yet copied to the screen
+        if Image is not None:
+            self._paint_img = Image.new("RGB", (800, 600), "white")
+            self._paint_draw = ImageDraw.Draw(self._paint_img)
+            # A blank photo is transparent, so the white canvas shows through until drawn on
+            self._paint_tk = tk.PhotoImage(master=self.canvas, width=800, height=600)
+            self.canvas.create_image(0, 0, anchor="nw", image=self._paint_tk)
+        self._paint_rgb = self._color_to_rgb(self.current_color)
+
+        self._last = (None, None) # Previous point of the stroke being drawn
+        self._pending_motion = None # Latest mouse-motion event not drawn yet
+        self._stroke_id = None # Canvas line item of the stroke being drawn
+        self._stroke_pts = None # Its flat [x0, y0, x1, y1, ...] coordinates
+        # Finished strokes as (item_id, (x0, y0, x1, y1), flat_pts), so a redraw of one
+        # region can find just the strokes crossing it. item_id is None with Pillow
+        self._strokes = []
+
+        self.canvas.bind("<ButtonPress-1>", self.start_stroke)
+        self.canvas.bind("<B1-Motion>", self._queue_motion)
         self.canvas.bind("<ButtonRelease-1>", self.reset_last_coords)
 
     def choose_color_for_paint(self):
-        color_choice = simpledialog.askstring("Choose Color", "Enter a color name (e.g., red, blue, green) or hex code (e.g., #FF5733):", initialvalue=self.current_color)
-        if color_choice:
-            self.current_color = color_choice
-            self.color_button.config(bg=self.current_color)
+        # The native picker always returns a valid hex code, or None if cancelled
+        _, hex_code = colorchooser.askcolor(initialcolor=self.current_color, title="Choose Color",
+                                            parent=self.color_button.winfo_toplevel())
+        if hex_code:
+            self.current_color = hex_code
+            self.color_button.config(bg=hex_code)
+            self._paint_rgb = self._color_to_rgb(hex_code)
+
+    def _color_to_rgb(self, color):
+        """
+        Resolves any Tk color name or hex code to an (r, g, b) tuple for Pillow.
+        """
+        return tuple(channel >> 8 for channel in self.canvas.winfo_rgb(color))
+
+    def clear_paint(self):
+        if self._paint_img is not None:
+            self._paint_draw.rectangle((0, 0, 800, 600), fill="white")
+            self._mark_paint_dirty(0, 0, 800, 600)
+        else:
+            # Only the drawn strokes, not every item on the canvas
+            self.canvas.delete("stroke")
+        self._strokes.clear()
+
+    def _mark_paint_dirty(self, x0, y0, x1, y1):
+        """
+        Adds a rectangle to the region of the paint image that needs copying to
+        the screen, and schedules that copy for the next idle moment.
+        """
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, 800), min(y1, 600)
+        if x0 >= x1 or y0 >= y1:
+            return
+        if self._paint_dirty is None:
+            self._paint_dirty = [x0, y0, x1, y1]
+            self.canvas.after_idle(self._blit_paint)
+        else:
+            dirty = self._paint_dirty
+            dirty[0], dirty[1] = min(dirty[0], x0), min(dirty[1], y0)
+            dirty[2], dirty[3] = max(dirty[2], x1), max(dirty[3], y1)
+
+    def _blit_paint(self):
+        """
+        Copies only the changed region of the paint image into the on-screen photo.
+        """
+        box, self._paint_dirty = self._paint_dirty, None
+        if box is None:
+            return
+        region = self._paint_img.crop(box)
+        # Raw RGB bytes behind a PPM header are something Tk's photo image can read directly
+        ppm = b"P6 %d %d 255\n" % region.size + region.tobytes()
+        self.canvas.tk.call(self._paint_tk, "put", ppm, "-format", "ppm", "-to", box[0], box[1])
     
+    def start_stroke(self, event):
+        """
+        Starts a stroke. Without Pillow the stroke is one canvas line item,
+        which draw_line then extends. It stays unsmoothed while drawn, so Tk
+        doesn't re-fit a spline through every point on each extension.
+        """
+        self._last = (event.x, event.y)
+        self._stroke_pts = [event.x, event.y]
+        if self._paint_img is not None:
+            return # Segments go straight into the image
+        self._stroke_id = self.canvas.create_line(event.x, event.y, event.x, event.y, fill=self.current_color,
+                                                  width=2, capstyle=tk.ROUND, smooth=tk.FALSE, tags=("stroke",))
+
+    def _queue_motion(self, event):
+        """
+        Holds on to a mouse-motion event and draws it at the next idle moment.
+        Motion events arriving before then replace it, so a burst of events
+        becomes a single line segment.
+        """
+        if self._pending_motion is None:
+            self.canvas.after_idle(self._flush_motion)
+        self._pending_motion = event
+
+    def _flush_motion(self):
+        event, self._pending_motion = self._pending_motion, None
+        if event is not None:
+            self.draw_line(event)
+
     def draw_line(self, event):
-        if self.last_x and self.last_y:
-            self.canvas.create_line(self.last_x, self.last_y, event.x, event.y,
-                                    fill=self.current_color, width=2, capstyle=tk.ROUND, smooth=tk.TRUE)
-        self.last_x, self.last_y = event.x, event.y
+        x, y = event.x, event.y
+        lx, ly = self._last
+        # Compare with None: 0 is a valid coordinate at the canvas edge
+        if lx is not None:
+            # Skip moves too small to see; the next segment starts from the same point
+            if abs(x - lx) < 2 and abs(y - ly) < 2:
+                return
+            pts = self._stroke_pts
+            pts += (x, y)
+            if self._paint_img is not None:
+                self._paint_draw.line((lx, ly, x, y), fill=self._paint_rgb, width=2)
+                # The segment's bounding box, padded for the line width
+                self._mark_paint_dirty(min(lx, x) - 2, min(ly, y) - 2, max(lx, x) + 3, max(ly, y) + 3)
+            else:
+                # Extend the stroke's line item rather than adding a new item per segment;
+                # its color, width and cap style were set once in start_stroke
+                self.canvas.coords(self._stroke_id, *pts)
+        self._last = (x, y)
 
     def reset_last_coords(self, event):
-        self.last_x, self.last_y = None, None
+        self._flush_motion() # Draw the end of the stroke before forgetting it
+        # Smoothing only changes lines with three or more points, so apply it once to the finished stroke
+        if self._stroke_id is not None and len(self._stroke_pts) > 4:
+            self.canvas.itemconfigure(self._stroke_id, smooth=tk.TRUE)
+        if self._stroke_pts is not None:
+            pts = tuple(self._stroke_pts)
+            xs, ys = pts[0::2], pts[1::2]
+            # Padded for the line width, like the dirty rectangles in draw_line
+            bbox = (min(xs) - 2, min(ys) - 2, max(xs) + 3, max(ys) + 3)
+            self._strokes.append((self._stroke_id, bbox, pts))
+        self._last = (None, None)
+        self._stroke_id, self._stroke_pts = None, None
     # --- END: Paint Application Methods ---
 
 